@@ -71,35 +71,58 @@ def analyze_image(path: Path) -> ImageMetrics:
     """
     try:
         with Image.open(path) as img:
-            width, height = img.size
-            aspect_ratio = width / height if height > 0 else 1.0
-            has_alpha = img.mode in ('RGBA', 'LA', 'PA')
-            file_size = path.stat().st_size
-
-            # Calculate transparency ratio only if image has alpha channel
-            if has_alpha:
-                img_loaded = img.convert('RGBA')
-                alpha_channel = img_loaded.split()[3]  # Get alpha channel
-                alpha_data = list(alpha_channel.getdata())
-                transparent_pixels = sum(1 for a in alpha_data if a < 128)  # < 50% opacity
-                transparency_ratio = transparent_pixels / len(alpha_data)
-            else:
-                transparency_ratio = 0.0
-
-            return ImageMetrics(
-                path=path,
-                width=width,
-                height=height,
-                aspect_ratio=aspect_ratio,
-                has_alpha=has_alpha,
-                transparency_ratio=transparency_ratio,
-                file_size=file_size
-            )
+            return measure_image(img, path)
     except Exception as e:
         logger.error(f"Failed to analyze image {path}: {e}")
         raise
 
 
+def measure_image(img: Image.Image, path: Path) -> ImageMetrics:
+    """
+    Extract metrics from an already opened image.
+
+    Only images with an alpha channel are decoded (to measure transparency);
+    for the rest just the header is read, so a caller can still apply
+    draft() before using the pixels.
+
+    Args:
+        img: Image opened from path
+        path: Path the image was opened from (used for the file size)
+
+    Returns:
+        ImageMetrics with extracted properties
+    """
+    width, height = img.size
+    aspect_ratio = width / height if height > 0 else 1.0
+    has_alpha = img.mode in ('RGBA', 'LA', 'PA')
+    file_size = path.stat().st_size
+
+    # Calculate transparency ratio only if image has alpha channel
+    if has_alpha:
+        # RGBA/LA carry alpha as a band; PA only after conversion
+        if img.mode == 'PA':
+            alpha_channel = img.convert('RGBA').getchannel('A')
+        else:
+            alpha_channel = img.getchannel('A')
+        # Count pixels below 50% opacity from the 256-bin histogram
+        # (computed in C) instead of iterating pixels in Python
+        histogram = alpha_channel.histogram()
+        transparent_pixels = sum(histogram[:128])
+        transparency_ratio = transparent_pixels / (width * height)
+    else:
+        transparency_ratio = 0.0
+
+    return ImageMetrics(
+        path=path,
+        width=width,
+        height=height,
+        aspect_ratio=aspect_ratio,
+        has_alpha=has_alpha,
+        transparency_ratio=transparency_ratio,
+        file_size=file_size
+    )
+
+
 def calculate_asset_scores(metrics: ImageMetrics) -> AssetScores:
     """
     Calculate classification scores based on image metrics.
@@ -212,6 +235,31 @@ def detect_asset_type(path: Path, min_confidence: float = 50.0) -> Tuple[Optiona
         asset_type will be None if confidence < min_confidence
     """
     metrics = analyze_image(path)
+    return _classify(metrics, min_confidence)
+
+
+def detect_asset_type_from_image(img: Image.Image, min_confidence: float = 50.0) -> Tuple[Optional[str], float, AssetScores]:
+    """
+    Detect the asset type of an image that is already open.
+
+    Lets callers that also need the pixels (e.g. for a preview thumbnail)
+    open and decode the file once.
+
+    Args:
+        img: Image opened from a file (img.filename must be set)
+        min_confidence: Minimum confidence score required (default: 50)
+
+    Returns:
+        Tuple of (asset_type, confidence, all_scores)
+        asset_type will be None if confidence < min_confidence
+    """
+    metrics = measure_image(img, Path(img.filename))
+    return _classify(metrics, min_confidence)
+
+
+def _classify(metrics: ImageMetrics, min_confidence: float) -> Tuple[Optional[str], float, AssetScores]:
+    """Score metrics and pick the winning asset type."""
+    path = metrics.path
     scores = calculate_asset_scores(metrics)
 
     # Log detailed analysis
@@ -6,7 +6,7 @@ parameters for all generated thumbnails. They can be overridden in config.json
 on a per-game basis if needed.
 """
 
-from typing import Tuple, List
+from typing import Tuple, List, FrozenSet
 
 # -----------------------------------------------------------
 # Image file extensions
@@ -15,6 +15,9 @@ from typing import Tuple, List
 # Supported image extensions (order matters - PNG first as most common)
 IMAGE_EXTENSIONS: List[str] = ['.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif', '.tiff', '.tif']
 
+# Same extensions for O(1) membership tests
+IMAGE_EXTENSION_SET: FrozenSet[str] = frozenset(IMAGE_EXTENSIONS)
+
 # -----------------------------------------------------------
 # Canvas specifications
 # -----------------------------------------------------------
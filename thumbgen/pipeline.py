@@ -12,14 +12,16 @@ Key improvements:
 
 from __future__ import annotations
 
+import logging
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from PIL import Image
 from PIL import Image, ImageFilter, ImageDraw
 
-from .loader import load_assets
+from .loader import load_assets, LoadedAssets
 from .errors import ProcessingError
 from .utils.logging import ok, error, heading
 from .utils.images import alpha_composite, save_png
@@ -30,61 +32,99 @@ from .renderer.text_block import render_text_block
 from .renderer.title_image import render_title_image
 from .provider_logo import render_provider_logo
 
-
-def generate_thumbnail(game_dir: Path, output_dir: Path, settings: dict = None) -> Optional[Path]:
+logger = logging.getLogger('thumbgen.pipeline')
+
+
+@lru_cache(maxsize=256)
+def _resolve_font(project_root: str, font_path: str) -> str:
+    """
+    Resolve a font path relative to the project root, memoized.
+
+    Path.resolve() costs a readlink/stat per path component, and previews
+    resolve the same handful of fonts on every request. Absolute paths are
+    returned unchanged.
+    """
+    if Path(font_path).is_absolute():
+        return font_path
+    return str((Path(project_root) / font_path).resolve())
+
+
+def build_game_config(game_dir: Path, settings: dict = None):
+    """
+    Build the GameConfig and provider font path for a game from UI settings.
+
+    Returns:
+        Tuple of (GameConfig, provider_font_path)
+    """
+    from .config import GameConfig, TitleImageConfig, ProviderLogoConfig
+    from .constants import DEFAULT_CHARACTER_HEIGHT_RATIO, DEFAULT_FONT_PATH
+
+    # Use default settings if none provided
+    if settings is None:
+        settings = {}
+
+    # Provider name from folder
+    provider_name = game_dir.parent.name
+
+    # Provider text from folder name if enabled
+    provider_text = provider_name if settings.get('provider_mode') == 'text' else ""
+
+    # Font selection (TITLE / MAIN TEXT):
+    # - custom_font (from UI) controls title/subtitle font
+    # - otherwise, use global DEFAULT_FONT_PATH
+    project_root = str(game_dir.parent.parent.parent)
+    if settings.get('custom_font'):
+        # Make relative paths absolute
+        font_path = _resolve_font(project_root, settings['custom_font'])
+    else:
+        font_path = DEFAULT_FONT_PATH
+
+    # Provider font selection (PROVIDER TEXT ONLY):
+    provider_font_path = settings.get('provider_font')
+    if provider_font_path:
+        provider_font_path = _resolve_font(project_root, provider_font_path)
+
+    cfg = GameConfig(
+        title_lines=[game_dir.name],
+        subtitle="",
+        provider_text=provider_text,
+        output_filename=f"{game_dir.name.lower().replace(' ', '_')}.png",
+        character_height_ratio=DEFAULT_CHARACTER_HEIGHT_RATIO,
+        font_path=font_path,
+        provider_logo=ProviderLogoConfig(
+            enabled=settings.get('provider_mode') == 'logo'
+        ),
+        title_image=TitleImageConfig(
+            enabled=settings.get('title_mode') == 'image'
+        ),
+        layout='crypto',
+        band_color=settings.get('blur_manual_color') if settings.get('blur_enabled') and settings.get('blur_manual_color') else None,
+    )
+
+    return cfg, provider_font_path
+
+
+def generate_thumbnail(
+    game_dir: Path,
+    output_dir: Path,
+    settings: dict = None,
+    assets: Optional[LoadedAssets] = None,
+) -> Optional[Path]:
     start_time = time.time()
 
     try:
-        from .config import GameConfig, TitleImageConfig, ProviderLogoConfig
-        from .constants import DEFAULT_CHARACTER_HEIGHT_RATIO, DEFAULT_FONT_PATH
-
         # Use default settings if none provided
         if settings is None:
             settings = {}
 
-        # Provider name from folder
-        provider_name = game_dir.parent.name
+        cfg, provider_font_path = build_game_config(game_dir, settings)
 
-        # Provider text from folder name if enabled
-        provider_text = provider_name if settings.get('provider_mode') == 'text' else ""
+        # Assets may be preloaded by the caller (e.g. bulk prefetch)
+        if assets is None:
+            # Extract asset filenames from settings if provided
+            asset_filenames = settings.get('asset_filenames', {})
+            assets = load_assets(game_dir, cfg, asset_filenames)
 
-        # Font selection (TITLE / MAIN TEXT):
-        # - custom_font (from UI) controls title/subtitle font
-        # - otherwise, use global DEFAULT_FONT_PATH
-        if settings.get('custom_font'):
-            font_path = settings['custom_font']
-            if not Path(font_path).is_absolute():
-                # Make relative paths absolute
-                font_path = str((game_dir.parent.parent.parent / font_path).resolve())
-        else:
-            font_path = DEFAULT_FONT_PATH
-
-        # Provider font selection (PROVIDER TEXT ONLY):
-        provider_font_path = settings.get('provider_font')
-        if provider_font_path and not Path(provider_font_path).is_absolute():
-            provider_font_path = str((game_dir.parent.parent.parent / provider_font_path).resolve())
-
-        cfg = GameConfig(
-            title_lines=[game_dir.name],
-            subtitle="",
-            provider_text=provider_text,
-            output_filename=f"{game_dir.name.lower().replace(' ', '_')}.png",
-            character_height_ratio=DEFAULT_CHARACTER_HEIGHT_RATIO,
-            font_path=font_path,
-            provider_logo=ProviderLogoConfig(
-                enabled=settings.get('provider_mode') == 'logo'
-            ),
-            title_image=TitleImageConfig(
-                enabled=settings.get('title_mode') == 'image'
-            ),
-            layout='crypto',
-            band_color=settings.get('blur_manual_color') if settings.get('blur_enabled') and settings.get('blur_manual_color') else None,
-        )
-
-        # Extract asset filenames from settings if provided
-        asset_filenames = settings.get('asset_filenames', {})
-
-        assets = load_assets(game_dir, cfg, asset_filenames)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # --------------------------------------------------------
@@ -107,7 +147,7 @@ def generate_thumbnail(game_dir: Path, output_dir: Path, settings: dict = None)
             # Extract custom dimensions from settings (or use defaults)
             canvas_width = settings.get('canvas_width', CANVAS_W)
             canvas_height = settings.get('canvas_height', CANVAS_H)
-            print(f"[PIPELINE] Using dimensions: {canvas_width}x{canvas_height} (settings: {settings.get('canvas_width')}, {settings.get('canvas_height')})", flush=True)
+            logger.debug("[PIPELINE] Using dimensions: %sx%s", canvas_width, canvas_height)
 
             canvas = render_crypto_card(
                 background=assets.background,
@@ -1,9 +1,14 @@
 from __future__ import annotations
+import logging
+from pathlib import Path
+
 from PIL import Image, ImageFilter, ImageDraw, ImageFont
 
 from ..constants import CANVAS_W, CANVAS_H, DEFAULT_FONT_PATH, get_provider_font
 from ..utils.images import alpha_composite
 
+logger = logging.getLogger('thumbgen.renderer')
+
 
 # -------------------------------------------------------------
 # Background Blur + Fade
@@ -57,9 +62,9 @@ def crypto_blur_background(bg: Image.Image, canvas_w: int = None, canvas_h: int
 def measure_text_block(lines, font_ratio, font_path, canvas_h, line_gap_ratio=0.01):
     draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
     size = max(1, int(canvas_h * font_ratio))  # Ensure minimum size of 1
-    from pathlib import Path
-    font_file_exists = Path(font_path or DEFAULT_FONT_PATH).exists() if font_path else True
-    print(f"[DEBUG MEASURE] Font path: {font_path}, Size: {size}, Exists: {font_file_exists}", flush=True)
+    if logger.isEnabledFor(logging.DEBUG):
+        font_file_exists = Path(font_path).exists() if font_path else True
+        logger.debug("[DEBUG MEASURE] Font path: %s, Size: %s, Exists: %s", font_path, size, font_file_exists)
     font = ImageFont.truetype(font_path or DEFAULT_FONT_PATH, size)
 
     total_height = 0
@@ -87,8 +92,7 @@ def draw_text_block(canvas, line_data, y_start, fill, canvas_width, canvas_heigh
 
     for line, font, _bbox, w, h in line_data:
         x = (canvas_width - w) // 2
-        font_name = font.getname() if hasattr(font, 'getname') else 'unknown'
-        print(f"[DEBUG DRAW] Drawing '{line}' with font {font} (family={font_name}) at ({x}, {y})", flush=True)
+        logger.debug("[DEBUG DRAW] Drawing %r with font %s at (%s, %s)", line, font, x, y)
         draw.text((x, y), line, font=font, fill=fill)
         y += h + int(canvas_height * 0.01)
 
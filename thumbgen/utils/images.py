@@ -7,6 +7,8 @@ improve readability and maintain consistency across rendering modules.
 
 from __future__ import annotations
 
+import os
+import threading
 from pathlib import Path
 from typing import Tuple
 
@@ -90,12 +92,22 @@ def save_png(image: Image.Image, path: Path) -> None:
     """
     Save an RGBA image as PNG with optimal quality settings.
 
+    The PNG is written to a temporary file beside the target and renamed
+    into place, so parallel bulk renders that share an output name never
+    leave a half-written file; the last one to finish wins.
+
     Args:
         image: RGBA image to save
         path: Output file path
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    image.save(path, format="PNG", compress_level=6, optimize=False)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        image.save(tmp_path, format="PNG", compress_level=6, optimize=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 # ------------------------------------------------------------
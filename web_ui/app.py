@@ -9,26 +9,108 @@ import webbrowser
 import subprocess
 import platform
 import os
+import re
+import shutil
+import tempfile
+import uuid
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from threading import Timer, Lock
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from threading import Thread, Timer, Lock
+from flask import Flask, Request, render_template, request, jsonify, send_file, send_from_directory, redirect, url_for
+from flask.json.provider import JSONProvider
 from werkzeug.utils import secure_filename
+from PIL import Image
 import io
-import base64
+import traceback
 from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # Fall back to Flask's default json provider
+    orjson = None
 
 # Add parent directory to path to import thumbgen
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from thumbgen import generate_thumbnail
+from thumbgen.pipeline import build_game_config
 from thumbgen.errors import ThumbgenError
+from thumbgen.asset_detector import detect_asset_type_from_image
 from thumbgen.loader import load_assets
-from thumbgen.config import GameConfig, TitleImageConfig, ProviderLogoConfig
 from thumbgen.renderer.crypto_card import render_crypto_card
-from thumbgen.constants import DEFAULT_CHARACTER_HEIGHT_RATIO, DEFAULT_FONT_PATH
+from thumbgen.constants import DEFAULT_FONT_PATH, IMAGE_EXTENSIONS, IMAGE_EXTENSION_SET
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson (C) for jsonify() and request.json."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype='application/json')
+
+
+class UploadSpool(io.FileIO):
+    """
+    Upload part that Werkzeug writes straight to disk (see ThumbgenRequest).
+
+    move_to() renames it into place, so saving an upload doesn't copy it a
+    second time. Parts that are never moved are deleted when Werkzeug closes
+    them at the end of the request.
+    """
+
+    def __init__(self, fd, path):
+        super().__init__(fd, 'r+')
+        self.path = path
+
+    def move_to(self, target):
+        super().close()
+        try:
+            os.replace(self.path, target)
+        except OSError:
+            # Different filesystem (or the file is locked on Windows)
+            shutil.move(self.path, target)
+
+    def close(self):
+        super().close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass  # Already moved
+
+
+class ThumbgenRequest(Request):
+    """Request that parses upload files directly to disk, beside their destination."""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Font parts go straight into fonts/, image parts into .upload_parts/
+        # (same filesystem as temp_uploads/). _clear_temp_uploads() touches
+        # neither, so a cleanup can't delete a part mid-upload.
+        spool_dir = {'upload_assets': UPLOAD_PARTS_DIR, 'upload_fonts': FONTS_DIR}.get(self.endpoint)
+        if spool_dir is None:
+            return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+        spool_dir.mkdir(exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix='.part-', dir=spool_dir)
+        return UploadSpool(fd, path)
+
 
 app = Flask(__name__)
+app.request_class = ThumbgenRequest
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Detect paths
 if getattr(sys, 'frozen', False):
@@ -42,14 +124,70 @@ THUMBNAILS_ROOT = BASE_DIR / "Thumbnails"
 OUTPUT_DIR = BASE_DIR / "output"
 FONTS_DIR = BASE_DIR / "fonts"
 PROVIDER_FONTS_FILE = BASE_DIR / "provider_fonts.json"
+TEMP_UPLOADS_DIR = Path(__file__).parent.parent / "temp_uploads"
+TEMP_THUMBS_DIR = TEMP_UPLOADS_DIR / ".thumbs"
+# Image uploads while they are still being received, see ThumbgenRequest
+UPLOAD_PARTS_DIR = TEMP_UPLOADS_DIR.parent / ".upload_parts"
 
 # Ensure required directories exist
 OUTPUT_DIR.mkdir(exist_ok=True)
 FONTS_DIR.mkdir(exist_ok=True)
 THUMBNAILS_ROOT.mkdir(exist_ok=True)
 
+# DEFAULT_FONT_PATH assignment in thumbgen/constants.py, rewritten by set_default_font
+_DEFAULT_FONT_PATTERN = re.compile(r'DEFAULT_FONT_PATH:\s*str\s*=\s*str\(_project_root\s*/\s*"[^"]+"\)')
+
+# Request tracing goes to DEBUG; THUMBGEN_DEBUG=1 turns it on when run directly
+logger = logging.getLogger('thumbgen.web_ui')
+
+# Extension priority when several files share a stem (lower wins)
+IMAGE_EXT_RANK = {ext: rank for rank, ext in enumerate(IMAGE_EXTENSIONS)}
+
+# Accepted font upload extensions
+FONT_EXTENSIONS = frozenset({'.ttf', '.otf'})
+
+# Game subfolder for each classified asset type (logos go to the provider)
+ASSET_SUBDIRS = {'background': 'Backgrounds', 'character': 'Character', 'title': 'Title'}
+
+# Threads used to classify and thumbnail uploaded images
+UPLOAD_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Worker processes used by bulk generation (1 = render serially in-process)
+BULK_MAX_WORKERS = os.cpu_count() or 1
+
+# Bulk worker pool, started lazily and kept for the life of the server so
+# each request doesn't pay process start-up again
+_bulk_pool = None
+_bulk_pool_lock = Lock()
+
+
+def get_images_in_folder(folder):
+    """Get all image file names in a folder from a single directory read."""
+    try:
+        with os.scandir(folder) as it:
+            names = [
+                entry.name for entry in it
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSION_SET
+            ]
+    except OSError:  # Missing or not a directory
+        return []
+    # Sort case-insensitively to match loader.py behavior
+    names.sort(key=str.lower)
+    return names
+
+
+def _provider_entries(root: Path):
+    """Provider folders under root as DirEntry objects, sorted by name."""
+    # DirEntry.is_dir() reuses the type from the directory read instead of
+    # a stat per entry
+    with os.scandir(root) as it:
+        return sorted(
+            (entry for entry in it if entry.is_dir(follow_symlinks=False)),
+            key=lambda entry: entry.name,
+        )
+
 
-def find_all_game_directories(root: Path):
+def find_all_game_directories(root: Path, provider_entries=None):
     """
     Find all game directories in Provider/Game structure.
 
@@ -57,107 +195,334 @@ def find_all_game_directories(root: Path):
 
     Args:
         root: Root directory to search (Thumbnails/)
+        provider_entries: Provider folders from _provider_entries(root), if
+            the caller already scanned them
 
     Returns:
-        List of Path objects pointing to game directories
+        List of (provider_name, game_name, game_dir) tuples, game_dir a Path
     """
     game_dirs = []
 
-    if not root.exists():
-        return game_dirs
+    if provider_entries is None:
+        if not root.exists():
+            return game_dirs
+        provider_entries = _provider_entries(root)
 
     # Traverse Provider/Game structure
-    for provider_dir in sorted(root.iterdir()):
-        if provider_dir.is_dir():
-            # Look for game folders inside provider folder
-            for game_dir in sorted(provider_dir.iterdir()):
-                if game_dir.is_dir():
-                    # Skip special folders like "Provider Logo"
-                    if game_dir.name.lower() not in ['provider logo', 'assets', '.git']:
-                        game_dirs.append(game_dir)
+    for provider_entry in provider_entries:
+        # Look for game folders inside provider folder
+        with os.scandir(provider_entry.path) as it:
+            game_entries = sorted(
+                (entry for entry in it if entry.is_dir(follow_symlinks=False)),
+                key=lambda entry: entry.name,
+            )
+        for game_entry in game_entries:
+            # Skip special folders like "Provider Logo"
+            if game_entry.name.lower() not in ('provider logo', 'assets', '.git'):
+                game_dirs.append((provider_entry.name, game_entry.name, Path(game_entry.path)))
 
     return game_dirs
 
 
+def get_game_directories():
+    """
+    Cached find_all_game_directories(THUMBNAILS_ROOT).
+
+    The scan is reused while Thumbnails/ and every provider folder keep
+    their mtimes (adding or removing a game touches its provider folder),
+    so a repeat call costs one stat per provider. The returned list is
+    shared; do not mutate it.
+    """
+    with _games_cache_lock:
+        signature = _dir_signature(_games_cache['dirs'])
+        if signature is None or signature != _games_cache['signature']:
+            # Stat each folder before reading it, so changes made mid-walk
+            # invalidate the entry on the next call. The walk reuses this
+            # provider scan, so every listed provider is in the signature.
+            root_signature = _dir_signature((str(THUMBNAILS_ROOT),))
+            try:
+                provider_entries = _provider_entries(THUMBNAILS_ROOT)
+            except FileNotFoundError:
+                return []
+            provider_dirs = [entry.path for entry in provider_entries]
+            provider_signature = _dir_signature(provider_dirs)
+            dirs = (str(THUMBNAILS_ROOT), *provider_dirs)
+            if root_signature is None or provider_signature is None:
+                _games_cache['signature'] = None
+            else:
+                _games_cache['signature'] = root_signature + provider_signature
+            _games_cache['dirs'] = dirs
+            _games_cache['game_dirs'] = find_all_game_directories(THUMBNAILS_ROOT, provider_entries)
+        return _games_cache['game_dirs']
+
+
+def invalidate_game_directories():
+    """Force the next get_game_directories() call to rescan Thumbnails/."""
+    with _games_cache_lock:
+        _games_cache['signature'] = None
+
+
+def _dir_signature(dirs):
+    """Return the mtimes of dirs, or None if any of them has vanished."""
+    try:
+        return tuple(os.stat(d).st_mtime_ns for d in dirs)
+    except OSError:
+        return None
+
+
+def _scandir_recursive(path, dirs, mtimes):
+    """
+    Yield DirEntry objects for the files under path, without following
+    symlinked folders.
+
+    Every folder visited is appended to dirs, with its mtime (taken before
+    the folder is read) appended to mtimes.
+    """
+    mtimes.append(os.stat(path).st_mtime_ns)
+    dirs.append(path)
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+    for subdir in subdirs:
+        yield from _scandir_recursive(subdir, dirs, mtimes)
+
+
 def get_available_fonts():
-    """Get list of available fonts in the fonts directory."""
-    fonts = []
+    """
+    Get list of available fonts in the fonts directory.
 
+    The sorted list is cached and rebuilt only when a folder under fonts/
+    changes mtime. Callers must not mutate the returned list.
+    """
     if not FONTS_DIR.exists():
-        return fonts
-
-    # Find all .ttf and .otf files
-    for font_file in FONTS_DIR.rglob("*.ttf"):
-        rel_path = font_file.relative_to(BASE_DIR)
-        fonts.append({
-            'path': str(rel_path).replace('\\', '/'),
-            'name': font_file.stem,
-            'family': font_file.parent.name
-        })
-
-    for font_file in FONTS_DIR.rglob("*.otf"):
-        rel_path = font_file.relative_to(BASE_DIR)
-        fonts.append({
-            'path': str(rel_path).replace('\\', '/'),
-            'name': font_file.stem,
-            'family': font_file.parent.name
-        })
+        return []
+
+    with _fonts_cache_lock:
+        signature = _dir_signature(_fonts_cache['dirs'])
+        if signature is None or signature != _fonts_cache['signature']:
+            fonts = []
+            dirs = []
+            mtimes = []
+
+            # Single walk, using the file type cached on each DirEntry
+            base_dir = str(BASE_DIR)
+            for entry in _scandir_recursive(str(FONTS_DIR), dirs, mtimes):
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() in ('.ttf', '.otf'):
+                    fonts.append({
+                        'path': os.path.relpath(entry.path, base_dir).replace('\\', '/'),
+                        'name': stem,
+                        'family': os.path.basename(os.path.dirname(entry.path))
+                    })
 
-    # Sort by family then name
-    fonts.sort(key=lambda x: (x['family'], x['name']))
+            # Sort by family then name, once per rebuild
+            fonts.sort(key=itemgetter('family', 'name'))
 
-    return fonts
+            _fonts_cache.update(dirs=tuple(dirs), signature=tuple(mtimes), fonts=fonts)
 
+        return _fonts_cache['fonts']
 
-def load_provider_fonts():
-    """Load provider font associations from JSON file."""
-    if not PROVIDER_FONTS_FILE.exists():
-        return {}
 
+def _read_provider_fonts():
+    """Parse provider font associations from the JSON file."""
     try:
         with open(PROVIDER_FONTS_FILE, 'r') as f:
             return json.load(f)
     except Exception as e:
-        print(f"Error loading provider fonts: {e}", flush=True)
+        logger.error("Error loading provider fonts: %s", e)
+        return {}
+
+
+def load_provider_fonts():
+    """
+    Load provider font associations from JSON file.
+
+    The parsed map is cached against the file's (mtime, size) and shared by
+    all threads, so repeat calls cost one stat. Treat the returned dict as
+    read-only; copy it before making changes.
+    """
+    try:
+        st = PROVIDER_FONTS_FILE.stat()
+    except OSError:
         return {}
 
+    key = (st.st_mtime_ns, st.st_size)
+    cached_key, cached_value = _pf_cache['entry']
+    if cached_key != key:
+        cached_value = _read_provider_fonts()
+        # Swap key and value together so readers never see a mixed pair
+        _pf_cache['entry'] = (key, cached_value)
+    return cached_value
+
 
 def save_provider_fonts(provider_fonts):
     """Save provider font associations to JSON file."""
     try:
-        with open(PROVIDER_FONTS_FILE, 'w') as f:
-            json.dump(provider_fonts, f, indent=2)
+        data = json.dumps(provider_fonts, indent=2).encode('utf-8')
+        try:
+            if PROVIDER_FONTS_FILE.read_bytes() == data:
+                return True  # Unchanged - skip the write and keep caches warm
+        except FileNotFoundError:
+            pass
+
+        # Write a temp file and swap it in, so a crash never leaves half a file
+        tmp_path = PROVIDER_FONTS_FILE.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, PROVIDER_FONTS_FILE)
+        _pf_cache['entry'] = (None, {})
+        # Cached previews hold the provider font resolved from the old map
+        preview_asset_cache.clear()
         return True
     except Exception as e:
-        print(f"Error saving provider fonts: {e}", flush=True)
+        logger.error("Error saving provider fonts: %s", e)
         return False
 
 
-class LRUCache:
-    """Thread-safe LRU cache for preview assets"""
-    def __init__(self, max_size=10):
-        self.cache = OrderedDict()
-        self.max_size = max_size
-        self.lock = Lock()
+class ShardedLRUCache:
+    """
+    Thread-safe LRU cache for preview assets.
+
+    Keys are spread over independent shards, each with its own OrderedDict
+    and lock, so concurrent previews of different games don't contend on a
+    single lock. Recency and eviction are tracked per shard.
+    """
+    def __init__(self, max_size=10, shards=8):
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        self.shard_size = max(1, -(-max_size // shards))  # ceil division
+        self.shards = [(OrderedDict(), Lock()) for _ in range(shards)]
+        self.mask = shards - 1
+
+    def _shard(self, key):
+        return self.shards[hash(key) & self.mask]
 
     def get(self, key):
-        with self.lock:
-            if key in self.cache:
-                self.cache.move_to_end(key)
-                return self.cache[key]
+        cache, lock = self._shard(key)
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
             return None
 
     def set(self, key, value):
-        with self.lock:
-            if key in self.cache:
-                self.cache.move_to_end(key)
-            self.cache[key] = value
-            if len(self.cache) > self.max_size:
-                self.cache.popitem(last=False)
+        cache, lock = self._shard(key)
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+            cache[key] = value
+            if len(cache) > self.shard_size:
+                cache.popitem(last=False)
+
+    def clear(self):
+        for cache, lock in self.shards:
+            with lock:
+                cache.clear()
+
+    def __len__(self):
+        return sum(len(cache) for cache, _ in self.shards)
+
+
+# Parsed provider_fonts.json as ((mtime_ns, size), map), see load_provider_fonts()
+_pf_cache = {'entry': (None, {})}
+
+# Sorted font list, valid while every folder under fonts/ keeps its mtime
+_fonts_cache = {'dirs': (), 'signature': None, 'fonts': []}
+_fonts_cache_lock = Lock()
+
+# Game directory list (and its serialized /api/games response), valid while
+# Thumbnails/ and every provider folder keep their mtimes
+_games_cache = {'dirs': (), 'signature': None, 'game_dirs': [], 'payload': None, 'payload_source': None}
+_games_cache_lock = Lock()
+
+# Provider names, valid while Thumbnails/ keeps its mtime
+_providers_cache = {'signature': None, 'providers': []}
+_providers_cache_lock = Lock()
+
+# Global preview cache: (game_path, settings..., selection, file mtimes) -> (cfg, provider_font_path).
+# Images are fetched through preview_image_cache, the only cache holding them.
+preview_asset_cache = ShardedLRUCache(max_size=10, shards=4)
+
+# Decoded preview images: (game_path, logo?, title?, selection, file mtimes) -> LoadedAssets.
+# Shared by every settings combination and pre-warmed when a game is opened.
+preview_image_cache = ShardedLRUCache(max_size=10, shards=4)
+
+# Background decoding for preview warm-up, bounded so it can't swamp the server
+_prefetch_pool = ThreadPoolExecutor(max_workers=2)
+
+
+def _selection_key(asset_filenames):
+    """Hashable form of the UI's asset_filenames selection."""
+    return (
+        asset_filenames.get('background'),
+        tuple(asset_filenames.get('characters') or ()),
+        asset_filenames.get('title'),
+        asset_filenames.get('logo'),
+    )
+
+
+def _first_mtime(*candidates):
+    """st_mtime_ns of the first existing path, or None."""
+    for path in candidates:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return None
+
+
+def _selection_stamp(game_dir, asset_filenames):
+    """
+    Modification times of the selected asset files, looked up where
+    load_assets() finds them, so re-exported images miss the preview caches.
+    """
+    background, characters, title, logo = _selection_key(asset_filenames)
+    stamp = [_first_mtime(game_dir / 'Backgrounds' / background, game_dir / background) if background else None]
+    stamp.extend(_first_mtime(game_dir / 'Character' / name, game_dir / name) for name in characters)
+    stamp.append(_first_mtime(game_dir / 'Title' / title, game_dir / title) if title else None)
+    stamp.append(_first_mtime(game_dir.parent / 'Provider Logo' / logo, game_dir / logo) if logo else None)
+    return tuple(stamp)
+
+
+def _load_preview_assets(game_path, game_dir, cfg, asset_filenames, stamp=None):
+    """load_assets() through the decoded-image cache."""
+    background, characters, title, logo = _selection_key(asset_filenames)
+    if stamp is None:
+        stamp = _selection_stamp(game_dir, asset_filenames)
+    logo_enabled = cfg.provider_logo.enabled
+    title_enabled = cfg.title_image.enabled
+    # Disabled title/logo images are never loaded, so their selection doesn't matter
+    key = (
+        game_path, logo_enabled, title_enabled, background, characters,
+        title if title_enabled else None,
+        logo if logo_enabled else None,
+        stamp,
+    )
+    assets = preview_image_cache.get(key)
+    if assets is None:
+        assets = load_assets(game_dir, cfg, asset_filenames)
+        preview_image_cache.set(key, assets)
+    return assets
+
+
+def _warm_preview_cache(game_path, game_dir, asset_filenames):
+    """Decode a game's default preview images ahead of the first preview request."""
+    try:
+        # Matches the single-mode form defaults (text title, text provider)
+        cfg, _ = build_game_config(game_dir, {'title_mode': 'text', 'provider_mode': 'text'})
+        _load_preview_assets(game_path, game_dir, cfg, asset_filenames)
+    except Exception as e:
+        logger.debug("[PREWARM] %s: %s", game_path, e)
 
 
-# Global preview asset cache
-preview_asset_cache = LRUCache(max_size=10)
+# Rendered index.html, filled on the first page load
+_index_cache = {'html': None}
 
 
 @app.route('/')
@@ -165,7 +530,15 @@ preview_asset_cache = LRUCache(max_size=10)
 @app.route('/single')
 def index():
     """Render main UI page - handles both bulk and single modes with client-side routing."""
-    return render_template('index.html')
+    # The page has no per-request data, so render it once. url_for() needs a
+    # request context, hence on the first hit rather than at import time.
+    # The debug server re-renders so template edits show up.
+    if app.debug or app.config.get('TEMPLATES_AUTO_RELOAD'):
+        return render_template('index.html')
+    html = _index_cache['html']
+    if html is None:
+        html = _index_cache['html'] = render_template('index.html')
+    return html
 
 
 @app.route('/api/fonts')
@@ -182,20 +555,25 @@ def get_fonts():
 def get_games():
     """Get list of all available games."""
     try:
-        game_dirs = find_all_game_directories(THUMBNAILS_ROOT)
-        games = []
-
-        for game_dir in game_dirs:
-            provider = game_dir.parent.name
-            game_name = game_dir.name
+        game_dirs = get_game_directories()
+
+        with _games_cache_lock:
+            # Re-serialize only when the cached directory list was rebuilt
+            if _games_cache['payload_source'] is not game_dirs:
+                games = []
+
+                for provider, game_name, _game_dir in game_dirs:
+                    games.append({
+                        'path': f"{provider}/{game_name}",
+                        'provider': provider,
+                        'name': game_name
+                    })
 
-            games.append({
-                'path': str(game_dir.relative_to(THUMBNAILS_ROOT)),
-                'provider': provider,
-                'name': game_name
-            })
+                _games_cache['payload'] = app.json.dumps({'success': True, 'games': games})
+                _games_cache['payload_source'] = game_dirs
+            payload = _games_cache['payload']
 
-        return jsonify({'success': True, 'games': games})
+        return app.response_class(payload, mimetype='application/json')
 
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -230,15 +608,19 @@ def get_game_details(game_path):
     try:
         game_dir = THUMBNAILS_ROOT / game_path
 
-        if not game_dir.exists():
+        # Check what assets exist with one directory read instead of a stat
+        # per file. normcase keeps Windows' case-insensitive matching.
+        try:
+            with os.scandir(game_dir) as it:
+                names = {os.path.normcase(entry.name) for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
             return jsonify({'success': False, 'error': 'Game not found'}), 404
 
-        # Check what assets exist
         assets = {
-            'background': (game_dir / "background.png").exists(),
-            'char': (game_dir / "char.png").exists(),
-            'title': (game_dir / "title.png").exists(),
-            'provider': (game_dir / "provider.png").exists(),
+            'background': os.path.normcase("background.png") in names,
+            'char': os.path.normcase("char.png") in names,
+            'title': os.path.normcase("title.png") in names,
+            'provider': os.path.normcase("provider.png") in names,
         }
 
         return jsonify({
@@ -256,94 +638,95 @@ def get_game_details(game_path):
 def get_game_assets(game_path):
     """Get list of all available assets for a game."""
     try:
-        # Normalize path separators - split by / and rejoin with Path
-        path_parts = game_path.split('/')
-        game_dir = THUMBNAILS_ROOT
-        for part in path_parts:
-            game_dir = game_dir / part
+        # Normalize path separators - split by / and join once
+        game_dir = Path(THUMBNAILS_ROOT, *game_path.split('/'))
 
-        print(f"[ASSETS] Request for: {game_path}", flush=True)
-        print(f"[ASSETS] Full path: {game_dir}", flush=True)
-        print(f"[ASSETS] Exists: {game_dir.exists()}", flush=True)
+        logger.debug("[ASSETS] Request for: %s (%s)", game_path, game_dir)
 
-        if not game_dir.exists():
+        # One directory read answers every "new folder vs old flat file" probe
+        try:
+            with os.scandir(game_dir) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
             return jsonify({'success': False, 'error': 'Game not found'}), 404
+        subfolders = {}  # normcase'd name -> path, case-insensitive on Windows like the loader
+        flat_images = {}  # lowercased stem -> (extension rank, file name)
+        for entry in entries:
+            if entry.is_dir():
+                subfolders[os.path.normcase(entry.name)] = entry.path
+            elif entry.is_file():
+                stem, ext = os.path.splitext(entry.name)
+                rank = IMAGE_EXT_RANK.get(ext.lower())
+                if rank is None:
+                    continue
+                stem = stem.lower()
+                current = flat_images.get(stem)
+                if current is None or rank < current[0]:
+                    flat_images[stem] = (rank, entry.name)
 
-        # Supported image extensions
-        image_exts = ['.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif', '.tiff', '.tif']
-
-        def get_images_in_folder(folder):
-            """Get all image files in a folder."""
-            if not folder.exists() or not folder.is_dir():
-                return []
-            images = []
-            for ext in image_exts:
-                images.extend(folder.glob(f"*{ext}"))
-            # Sort case-insensitively to match loader.py behavior
-            return sorted([img.name for img in images], key=str.lower)
+        def find_flat_image(stem):
+            """Old structure - <stem>.<ext> in the game folder, by extension priority."""
+            found = flat_images.get(stem)
+            return found[1] if found else None
 
         # Get backgrounds
         backgrounds = []
-        backgrounds_folder = game_dir / "Backgrounds"
-        if backgrounds_folder.exists():
+        backgrounds_folder = subfolders.get(os.path.normcase("Backgrounds"))
+        if backgrounds_folder:
             backgrounds = get_images_in_folder(backgrounds_folder)
         else:
             # Old structure - look for background.* in game folder
-            for ext in image_exts:
-                bg_file = game_dir / f"background{ext}"
-                if bg_file.exists():
-                    backgrounds.append(bg_file.name)
-                    break
+            bg_file = find_flat_image("background")
+            if bg_file:
+                backgrounds.append(bg_file)
 
         # Get characters
         characters = []
-        character_folder = game_dir / "Character"
-        if character_folder.exists():
+        character_folder = subfolders.get(os.path.normcase("Character"))
+        if character_folder:
             characters = get_images_in_folder(character_folder)
         else:
             # Old structure - look for character*.* in game folder
             for i in range(1, 10):  # Support up to 9 characters
-                found = False
-                for ext in image_exts:
-                    char_file = game_dir / f"character{i}{ext}"
-                    if char_file.exists():
-                        characters.append(char_file.name)
-                        found = True
-                        break
-                if not found:
+                char_file = find_flat_image(f"character{i}")
+                if not char_file:
                     break
+                characters.append(char_file)
             # If no numbered, try single character.*
             if not characters:
-                for ext in image_exts:
-                    char_file = game_dir / f"character{ext}"
-                    if char_file.exists():
-                        characters.append(char_file.name)
-                        break
+                char_file = find_flat_image("character")
+                if char_file:
+                    characters.append(char_file)
 
         # Get titles
         titles = []
-        title_folder = game_dir / "Title"
-        if title_folder.exists():
+        title_folder = subfolders.get(os.path.normcase("Title"))
+        if title_folder:
             titles = get_images_in_folder(title_folder)
         else:
-            for ext in image_exts:
-                title_file = game_dir / f"title{ext}"
-                if title_file.exists():
-                    titles.append(title_file.name)
-                    break
+            title_file = find_flat_image("title")
+            if title_file:
+                titles.append(title_file)
 
         # Get provider logos
         logos = []
-        provider_dir = game_dir.parent
-        logo_folder = provider_dir / "Provider Logo"
-        if logo_folder.exists():
+        logo_folder = game_dir.parent / "Provider Logo"
+        if logo_folder.is_dir():
             logos = get_images_in_folder(logo_folder)
         else:
-            for ext in image_exts:
-                logo_file = game_dir / f"logo{ext}"
-                if logo_file.exists():
-                    logos.append(logo_file.name)
-                    break
+            logo_file = find_flat_image("logo")
+            if logo_file:
+                logos.append(logo_file)
+
+        # The UI previews the first of each asset right after this call, so
+        # start decoding them now
+        if backgrounds and characters:
+            default_selection = {'background': backgrounds[0], 'characters': [characters[0]]}
+            if titles:
+                default_selection['title'] = titles[0]
+            if logos:
+                default_selection['logo'] = logos[0]
+            _prefetch_pool.submit(_warm_preview_cache, game_path, game_dir, default_selection)
 
         return jsonify({
             'success': True,
@@ -370,19 +753,13 @@ def get_asset_preview():
             return jsonify({'success': False, 'error': 'Missing parameters'}), 400
 
         # Normalize game path
-        path_parts = game_path.split('/')
-        game_dir = THUMBNAILS_ROOT
-        for part in path_parts:
-            game_dir = game_dir / part
+        game_dir = Path(THUMBNAILS_ROOT, *game_path.split('/'))
 
         # Resolve full asset path (normalize path separators)
         asset_path_normalized = asset_path.replace('/', '\\' if '\\' in str(game_dir) else '/')
         full_asset_path = game_dir / asset_path_normalized
 
-        print(f"[PREVIEW] Game path: {game_path}", flush=True)
-        print(f"[PREVIEW] Asset path: {asset_path}", flush=True)
-        print(f"[PREVIEW] Full path: {full_asset_path}", flush=True)
-        print(f"[PREVIEW] Exists: {full_asset_path.exists()}", flush=True)
+        logger.debug("[PREVIEW] %s / %s -> %s", game_path, asset_path, full_asset_path)
 
         if not full_asset_path.exists():
             return jsonify({'success': False, 'error': f'Asset not found: {full_asset_path}'}), 404
@@ -391,7 +768,7 @@ def get_asset_preview():
         return send_file(str(full_asset_path), mimetype='image/png')
 
     except Exception as e:
-        print(f"[PREVIEW ERROR] {e}", flush=True)
+        logger.error("[PREVIEW ERROR] %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -417,9 +794,9 @@ def generate_single():
         provider_fonts_map = load_provider_fonts()
         if provider_name in provider_fonts_map and not settings.get('provider_font'):
             settings['provider_font'] = provider_fonts_map[provider_name]
-            print(f"[PROVIDER FONT] Using provider default for {provider_name}: {settings['provider_font']}", flush=True)
+            logger.debug("[PROVIDER FONT] Using provider default for %s: %s", provider_name, settings['provider_font'])
         if settings.get('custom_font'):
-            print(f"[PROVIDER FONT] Using custom title font override: {settings.get('custom_font')}", flush=True)
+            logger.debug("[PROVIDER FONT] Using custom title font override: %s", settings.get('custom_font'))
 
         # Generate thumbnail with settings (no config.json needed)
         result_path = generate_thumbnail(game_dir, OUTPUT_DIR, settings=settings)
@@ -431,15 +808,11 @@ def generate_single():
         })
 
     except ThumbgenError as e:
-        import traceback
-        print(f"[ERROR] ThumbgenError: {e}", flush=True)
-        traceback.print_exc()
+        logger.exception("[ERROR] ThumbgenError: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 400
 
     except Exception as e:
-        import traceback
-        print(f"[ERROR] Exception: {e}", flush=True)
-        traceback.print_exc()
+        logger.exception("[ERROR] Exception: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -458,58 +831,36 @@ def preview_live():
         if not game_dir.exists():
             return jsonify({'success': False, 'error': 'Game directory not found'}), 404
 
-        # Check cache for assets (but skip cache if custom assets are selected)
+        # Check cache. The key covers every setting that feeds the fonts and
+        # config; slider values are applied at render time.
         asset_filenames = settings.get('asset_filenames', {})
-        cache_key = game_path if not asset_filenames else None
-        cached_assets = preview_asset_cache.get(cache_key) if cache_key else None
-
-        # Provider name from folder
-        provider_name = game_dir.parent.name
-        provider_text = provider_name if settings.get('provider_mode') == 'text' else ""
+        stamp = _selection_stamp(game_dir, asset_filenames)
+        cache_key = (
+            game_path,
+            settings.get('custom_font'),
+            settings.get('provider_font'),
+            settings.get('provider_mode'),
+            settings.get('title_mode'),
+            settings.get('blur_manual_color'),
+            settings.get('blur_enabled'),
+            _selection_key(asset_filenames),
+            stamp,
+        )
+        cached = preview_asset_cache.get(cache_key)
 
-        # Apply provider default font for PROVIDER TEXT only (not title),
-        # unless a custom font override is specified from the UI.
-        provider_fonts_map = load_provider_fonts()
-        if provider_name in provider_fonts_map and not settings.get('provider_font'):
-            settings['provider_font'] = provider_fonts_map[provider_name]
+        if cached is None:
+            # Apply provider default font for PROVIDER TEXT only (not title),
+            # unless a custom font override is specified from the UI.
+            provider_name = game_dir.parent.name
+            provider_fonts_map = load_provider_fonts()
+            if provider_name in provider_fonts_map and not settings.get('provider_font'):
+                settings['provider_font'] = provider_fonts_map[provider_name]
 
-        # Font selection (TITLE / MAIN TEXT)
-        if settings.get('custom_font'):
-            font_path = settings['custom_font']
-            if not Path(font_path).is_absolute():
-                font_path = str((game_dir.parent.parent.parent / font_path).resolve())
-        else:
-            # Use default font for title text (not provider font)
-            font_path = DEFAULT_FONT_PATH
-
-        # Provider font selection (PROVIDER TEXT ONLY)
-        provider_font_path = settings.get('provider_font')
-        if provider_font_path and not Path(provider_font_path).is_absolute():
-            provider_font_path = str((game_dir.parent.parent.parent / provider_font_path).resolve())
-
-        # Create config
-        cfg = GameConfig(
-            title_lines=[game_dir.name],
-            subtitle="",
-            provider_text=provider_text,
-            output_filename=f"{game_dir.name.lower().replace(' ', '_')}.png",
-            character_height_ratio=DEFAULT_CHARACTER_HEIGHT_RATIO,
-            font_path=font_path,
-            provider_logo=ProviderLogoConfig(
-                enabled=settings.get('provider_mode') == 'logo'
-            ),
-            title_image=TitleImageConfig(
-                enabled=settings.get('title_mode') == 'image'
-            ),
-            layout='crypto',
-            band_color=settings.get('blur_manual_color') if settings.get('blur_enabled') and settings.get('blur_manual_color') else None,
-        )
+            cached = build_game_config(game_dir, settings)
+            preview_asset_cache.set(cache_key, cached)
 
-        # Load or use cached assets
-        if cached_assets is None:
-            cached_assets = load_assets(game_dir, cfg, asset_filenames)
-            if cache_key:  # Only cache if not using custom asset selections
-                preview_asset_cache.set(cache_key, cached_assets)
+        cfg, provider_font_path = cached
+        cached_assets = _load_preview_assets(game_path, game_dir, cfg, asset_filenames, stamp)
 
         # Parse settings
         blur_enabled = settings.get('blur_enabled', True)
@@ -535,24 +886,73 @@ def preview_live():
             text_offset=text_offset,
         )
 
-        # Convert to base64
+        # Send raw PNG bytes. Previews are thrown away on the next slider
+        # move, so favour encode speed over size.
         buffer = io.BytesIO()
-        canvas.save(buffer, format='PNG')
+        canvas.save(buffer, format='PNG', optimize=False, compress_level=1)
         buffer.seek(0)
-        img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
 
-        return jsonify({
-            'success': True,
-            'preview_image': f'data:image/png;base64,{img_base64}'
-        })
+        return send_file(buffer, mimetype='image/png', download_name='preview.png')
 
     except Exception as e:
-        import traceback
-        print(f"[ERROR] Preview failed: {e}", flush=True)
-        traceback.print_exc()
+        logger.exception("[ERROR] Preview failed: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def _resolve_settings(settings, provider_name, provider_fonts_map):
+    """Build the bulk settings shared by every game of one provider."""
+    # Apply provider default font for PROVIDER TEXT only (not title),
+    # unless a provider_font override is already present.
+    if provider_name in provider_fonts_map and not settings.get('provider_font'):
+        provider_settings = settings.copy()
+        provider_settings['provider_font'] = provider_fonts_map[provider_name]
+        logger.debug("[PROVIDER FONT] Using provider default for %s: %s", provider_name, provider_settings['provider_font'])
+        return provider_settings
+    return settings
+
+
+def _load_game_assets(game_dir, settings):
+    """Load a game's images for bulk generation (runs on the prefetch thread)."""
+    cfg, _ = build_game_config(game_dir, settings)
+    return load_assets(game_dir, cfg, settings.get('asset_filenames', {}))
+
+
+def _generate_one(game_dir_str, output_dir_str, settings, assets=None):
+    """
+    Render one bulk thumbnail and return the output path as a string.
+
+    Kept at module level with plain-string arguments so it pickles cheaply
+    into worker processes.
+    """
+    # Generate thumbnail with settings (no config.json needed)
+    result_path = generate_thumbnail(Path(game_dir_str), Path(output_dir_str), settings=settings, assets=assets)
+    return str(result_path)
+
+
+def _get_bulk_pool():
+    """Return the shared bulk worker pool, starting it on first use."""
+    global _bulk_pool
+    with _bulk_pool_lock:
+        if _bulk_pool is None:
+            # spawn, not fork: the pool starts from a request thread while
+            # other threads may hold locks (stdout, logging) a forked child
+            # would inherit locked. Matches the Windows exe's behaviour.
+            _bulk_pool = ProcessPoolExecutor(
+                max_workers=BULK_MAX_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _bulk_pool
+
+
+def _reset_bulk_pool(pool):
+    """Drop a broken worker pool so the next request starts a new one."""
+    global _bulk_pool
+    with _bulk_pool_lock:
+        if _bulk_pool is pool:
+            _bulk_pool = None
+    pool.shutdown(wait=False)
+
+
 @app.route('/api/generate-bulk', methods=['POST'])
 def generate_bulk():
     """Generate thumbnails for multiple games."""
@@ -561,7 +961,7 @@ def generate_bulk():
         game_paths = data.get('game_paths', [])
         settings = data.get('settings', {})
 
-        print(f"[BULK GEN] Received settings: {settings}", flush=True)
+        logger.debug("[BULK GEN] Received settings: %s", settings)
 
         # Validate custom dimensions if provided
         if 'canvas_width' in settings or 'canvas_height' in settings:
@@ -577,53 +977,83 @@ def generate_bulk():
 
             settings['canvas_width'] = width
             settings['canvas_height'] = height
-            print(f"[BULK GEN] Using custom dimensions: {width}x{height}", flush=True)
+            logger.debug("[BULK GEN] Using custom dimensions: %sx%s", width, height)
 
         if not game_paths:
             return jsonify({'success': False, 'error': 'No games selected'}), 400
 
-        results = []
-        success_count = 0
+        results = [None] * len(game_paths)
         provider_fonts_map = load_provider_fonts()
-        print(f"[BULK GEN] Loaded provider fonts map: {provider_fonts_map}", flush=True)
-
-        for game_path in game_paths:
-            try:
-                game_dir = THUMBNAILS_ROOT / game_path
-
-                if not game_dir.exists():
-                    results.append({
-                        'game': game_path,
-                        'success': False,
-                        'error': 'Game not found'
-                    })
-                    continue
-
-                # Apply provider default font for PROVIDER TEXT only (not title),
-                # unless a provider_font override is already present.
-                game_settings = settings.copy()
-                provider_name = game_dir.parent.name
-                print(f"[BULK GEN] Game: {game_dir.name}, Provider: {provider_name}, Current provider_font: {game_settings.get('provider_font')}", flush=True)
-                if provider_name in provider_fonts_map and not game_settings.get('provider_font'):
-                    game_settings['provider_font'] = provider_fonts_map[provider_name]
-                    print(f"[PROVIDER FONT] {game_dir.name}: Using provider default for {provider_name}: {game_settings['provider_font']}", flush=True)
-
-                # Generate thumbnail with settings (no config.json needed)
-                result_path = generate_thumbnail(game_dir, OUTPUT_DIR, settings=game_settings)
-
-                results.append({
+        logger.debug("[BULK GEN] Loaded provider fonts map: %s", provider_fonts_map)
+
+        # Resolve per-game work up front; missing games fail immediately.
+        # Games of the same provider share one settings dict (nothing downstream
+        # mutates it), so it is built once per provider rather than per game.
+        jobs = {}
+        settings_by_provider = {}
+        for index, game_path in enumerate(game_paths):
+            game_dir = THUMBNAILS_ROOT / game_path
+            if not game_dir.exists():
+                results[index] = {
                     'game': game_path,
+                    'success': False,
+                    'error': 'Game not found'
+                }
+                continue
+            provider_name = game_dir.parent.name
+            game_settings = settings_by_provider.get(provider_name)
+            if game_settings is None:
+                game_settings = _resolve_settings(settings, provider_name, provider_fonts_map)
+                settings_by_provider[provider_name] = game_settings
+            jobs[index] = (game_dir, game_settings)
+
+        def record(index, result_path=None, error=None):
+            if error is None:
+                results[index] = {
+                    'game': game_paths[index],
                     'success': True,
-                    'output': str(result_path.relative_to(OUTPUT_DIR))
-                })
-                success_count += 1
-
-            except Exception as e:
-                results.append({
-                    'game': game_path,
+                    'output': str(Path(result_path).relative_to(OUTPUT_DIR))
+                }
+            else:
+                results[index] = {
+                    'game': game_paths[index],
                     'success': False,
-                    'error': str(e)
-                })
+                    'error': str(error)
+                }
+
+        if min(BULK_MAX_WORKERS, len(jobs)) <= 1:
+            # Serial: decode the next game's assets on a prefetch thread while
+            # the current one renders, hiding disk I/O behind PIL compositing
+            work = list(jobs.items())
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                pending = prefetcher.submit(_load_game_assets, *work[0][1]) if work else None
+                for position, (index, (game_dir, game_settings)) in enumerate(work):
+                    assets_future = pending
+                    if position + 1 < len(work):
+                        pending = prefetcher.submit(_load_game_assets, *work[position + 1][1])
+                    try:
+                        assets = assets_future.result()
+                        record(index, _generate_one(str(game_dir), str(OUTPUT_DIR), game_settings, assets))
+                    except Exception as e:
+                        record(index, error=e)
+        else:
+            # Each game is independent CPU-bound PIL work, so fan out across processes
+            pool = _get_bulk_pool()
+            futures = {
+                pool.submit(_generate_one, str(game_dir), str(OUTPUT_DIR), game_settings): index
+                for index, (game_dir, game_settings) in jobs.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    record(futures[future], future.result())
+                except BrokenProcessPool as e:
+                    # A worker died; start a fresh pool on the next request
+                    _reset_bulk_pool(pool)
+                    record(futures[future], error=e)
+                except Exception as e:
+                    record(futures[future], error=e)
+
+        success_count = sum(1 for r in results if r['success'])
 
         return jsonify({
             'success': True,
@@ -675,7 +1105,7 @@ def set_provider_font():
         if not font_path:
             return jsonify({'success': False, 'error': 'Font path is required'}), 400
 
-        provider_fonts = load_provider_fonts()
+        provider_fonts = dict(load_provider_fonts())
         provider_fonts[provider] = font_path
 
         if save_provider_fonts(provider_fonts):
@@ -691,7 +1121,7 @@ def set_provider_font():
 def delete_provider_font(provider):
     """Remove default font for a provider."""
     try:
-        provider_fonts = load_provider_fonts()
+        provider_fonts = dict(load_provider_fonts())
 
         if provider not in provider_fonts:
             return jsonify({'success': False, 'error': 'Provider not found'}), 404
@@ -758,28 +1188,31 @@ def set_default_font():
             font_path_str = str(Path(font_path)).replace('\\', '/')
 
         # Replace the DEFAULT_FONT_PATH line
-        import re
-        pattern = r'DEFAULT_FONT_PATH:\s*str\s*=\s*str\(_project_root\s*/\s*"[^"]+"\)'
         replacement = f'DEFAULT_FONT_PATH: str = str(_project_root / "{font_path_str}")'
+        new_content, count = _DEFAULT_FONT_PATTERN.subn(replacement, content)
 
-        new_content = re.sub(pattern, replacement, content)
-
-        # Check if pattern was found (even if replacement is identical)
-        if not re.search(pattern, content):
+        if count == 0:
             return jsonify({'success': False, 'error': 'DEFAULT_FONT_PATH not found in constants.py'}), 500
 
-        # Write back to file (even if content is the same, this is a valid operation)
-        with open(constants_file, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        # Nothing to write or reload when the font is already the default
+        if new_content != content:
+            with open(constants_file, 'w', encoding='utf-8') as f:
+                f.write(new_content)
 
-        # Reload the constants module to apply changes immediately
-        import importlib
-        import thumbgen.constants
-        importlib.reload(thumbgen.constants)
+            # Reload the constants module to apply changes immediately
+            import importlib
+            import thumbgen.constants
+            importlib.reload(thumbgen.constants)
 
-        # Update the global DEFAULT_FONT_PATH in this module
-        global DEFAULT_FONT_PATH
-        from thumbgen.constants import DEFAULT_FONT_PATH
+            # Update the global DEFAULT_FONT_PATH in this module
+            global DEFAULT_FONT_PATH
+            from thumbgen.constants import DEFAULT_FONT_PATH
+            preview_asset_cache.clear()
+
+            # Bulk workers imported the old constants; start fresh ones
+            pool = _bulk_pool
+            if pool is not None:
+                _reset_bulk_pool(pool)
 
         font_name = Path(font_path).name
         return jsonify({
@@ -788,7 +1221,6 @@ def set_default_font():
         })
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -829,6 +1261,8 @@ def create_game():
         provider_logo_dir = THUMBNAILS_ROOT / provider_name / 'Provider Logo'
         provider_logo_dir.mkdir(exist_ok=True)
 
+        invalidate_game_directories()
+
         game_path = f"{provider_name}/{game_name}"
 
         return jsonify({
@@ -839,7 +1273,6 @@ def create_game():
         })
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -850,13 +1283,23 @@ def get_providers():
     Get list of all providers (top-level directories in Thumbnails).
     """
     try:
-        providers = []
-        if THUMBNAILS_ROOT.exists():
-            for item in THUMBNAILS_ROOT.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    providers.append(item.name)
+        with _providers_cache_lock:
+            # Adding or removing a provider folder bumps the root's mtime
+            signature = _dir_signature((THUMBNAILS_ROOT,))
+            if signature is None or signature != _providers_cache['signature']:
+                # DirEntry.is_dir() reuses the type from the directory read
+                try:
+                    with os.scandir(THUMBNAILS_ROOT) as it:
+                        providers = sorted(
+                            entry.name for entry in it
+                            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')
+                        )
+                except FileNotFoundError:
+                    providers = []
+                _providers_cache['signature'] = signature
+                _providers_cache['providers'] = providers
+            providers = _providers_cache['providers']
 
-        providers.sort()
         return jsonify({
             'success': True,
             'providers': providers
@@ -866,6 +1309,119 @@ def get_providers():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/temp-thumb/<name>')
+def temp_thumb(name):
+    """
+    Serve the preview thumbnail of an uploaded, not yet classified image.
+
+    Thumbnails are stored as WebP; ?fmt=png converts on the fly for
+    browsers without WebP support.
+    """
+    if request.args.get('fmt') != 'png':
+        return send_from_directory(TEMP_THUMBS_DIR, f"{name}.webp", max_age=3600)
+
+    thumb_path = TEMP_THUMBS_DIR / f"{_safe_filename(name)}.webp"
+    if not thumb_path.is_file():
+        return jsonify({'success': False, 'error': 'Thumbnail not found'}), 404
+    buffer = io.BytesIO()
+    with Image.open(thumb_path) as img:
+        img.save(buffer, format='PNG', compress_level=1)
+    buffer.seek(0)
+    return send_file(buffer, mimetype='image/png', max_age=3600)
+
+
+@lru_cache(maxsize=4096)
+def _safe_filename(name):
+    """secure_filename, memoized (re-uploads and retries repeat the same names)."""
+    return secure_filename(name)
+
+
+def unique_path(dirpath, stem, ext):
+    """
+    Return dirpath/<stem><ext>, or the first free <stem>_<n><ext>.
+
+    Reads the directory once instead of stat-ing each candidate. Names are
+    compared case-insensitively so a suffix is also added on filesystems
+    that would treat "Logo.png" and "logo.png" as the same file.
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            existing = {entry.name.lower() for entry in it}
+    except FileNotFoundError:
+        existing = set()
+
+    name = f"{stem}{ext}"
+    counter = 1
+    while name.lower() in existing:
+        name = f"{stem}_{counter}{ext}"
+        counter += 1
+    return Path(dirpath) / name
+
+
+def _save_upload(file, path):
+    """
+    Write an uploaded file to disk.
+
+    Both upload endpoints have their parts spooled to disk as they arrive
+    (see ThumbgenRequest), so saving is a rename rather than a copy.
+    """
+    file.stream.move_to(path)
+
+
+def _analyze_upload(filename, temp_filename, temp_path, manual_thumbs_only=False):
+    """
+    Classify one saved upload and build its result entry with a preview thumbnail.
+
+    With manual_thumbs_only, confidently classified images get no thumbnail
+    ('thumbnail' is None) and are never fully decoded for one.
+    """
+    try:
+        # Open once for both detection and the preview thumbnail, served by
+        # /api/temp-thumb. Detection only decodes images with alpha.
+        thumb_path = TEMP_THUMBS_DIR / f"{temp_filename}.webp"
+        thumbnail = None
+        with Image.open(temp_path) as img:
+            asset_type, confidence, scores = detect_asset_type_from_image(img)
+
+            if not manual_thumbs_only or asset_type is None:
+                # Let libjpeg scale down while decoding (no-op for other formats
+                # and for images detection already decoded)
+                img.draft('RGB', (300, 300))
+                # Create thumbnail (max 150x150); BILINEAR is plenty at this size
+                img.thumbnail((150, 150), Image.Resampling.BILINEAR)
+                # WebP is far smaller than PNG for photographic assets; method=0
+                # is the fastest encoder setting
+                img.save(thumb_path, format='WEBP', quality=80, method=0)
+                # Re-uploading the same name must not hit the browser's cached copy
+                version = thumb_path.stat().st_mtime_ns
+                thumbnail = f'/api/temp-thumb/{temp_filename}?v={version}'
+
+        return {
+            'filename': filename,
+            'temp_filename': temp_filename,
+            'success': True,
+            'detected_type': asset_type,  # None if confidence < 50
+            'confidence': confidence,
+            'scores': {
+                'background': scores.background,
+                'character': scores.character,
+                'title': scores.title,
+                'logo': scores.logo
+            },
+            'thumbnail': thumbnail,
+            'requires_manual': asset_type is None  # True if confidence < 50
+        }
+
+    except Exception as e:
+        return {
+            'filename': filename,
+            'success': False,
+            'error': str(e),
+            'detected_type': None,
+            'confidence': 0
+        }
+
+
 @app.route('/api/upload-assets', methods=['POST'])
 def upload_assets():
     """
@@ -879,25 +1435,26 @@ def upload_assets():
         files = request.files.getlist('files')
         game_path = request.form.get('game_path', '')
         provider_path = request.form.get('provider_path', '')
+        # ?thumbnails=manual-only: only images needing manual review get a preview
+        manual_thumbs_only = request.args.get('thumbnails', 'always') == 'manual-only'
 
         if not files:
             return jsonify({'success': False, 'error': 'No files selected'}), 400
 
-        # Import detection module
-        from thumbgen.asset_detector import detect_asset_type
-        from thumbgen.constants import IMAGE_EXTENSIONS
-
         results = []
-        temp_dir = Path(__file__).parent.parent / 'temp_uploads'
-        temp_dir.mkdir(exist_ok=True)
+        jobs = []  # (original filename, temp filename, temp path), one per None in results
+        temp_dir = TEMP_UPLOADS_DIR
+        TEMP_THUMBS_DIR.mkdir(parents=True, exist_ok=True)
 
+        # Save uploads one at a time (request streams aren't thread-safe),
+        # then analyze them in parallel
         for file in files:
             if file.filename == '':
                 continue
 
             # Check file extension
-            file_ext = Path(file.filename).suffix.lower()
-            if file_ext not in IMAGE_EXTENSIONS:
+            file_ext = os.path.splitext(file.filename)[1].lower()
+            if file_ext not in IMAGE_EXTENSION_SET:
                 results.append({
                     'filename': file.filename,
                     'success': False,
@@ -908,59 +1465,52 @@ def upload_assets():
                 continue
 
             # Save temporarily for analysis
-            safe_filename = secure_filename(file.filename)
+            safe_filename = _safe_filename(file.filename)
             temp_path = temp_dir / safe_filename
-            file.save(str(temp_path))
+            _save_upload(file, temp_path)
+            jobs.append((file.filename, safe_filename, temp_path))
+            results.append(None)
+
+        header = {'success': True, 'game_path': game_path, 'provider_path': provider_path, 'total': len(results)}
+
+        def generate():
+            """Yield NDJSON: the header, then each file's result in upload order."""
+            yield app.json.dumps(header) + '\n'
+            # Pillow decode/resize releases the GIL, so threads overlap the work
+            with ThreadPoolExecutor(max_workers=max(1, min(UPLOAD_MAX_WORKERS, len(jobs)))) as pool:
+                analyzed = pool.map(lambda job: _analyze_upload(*job, manual_thumbs_only), jobs)
+                for result in results:
+                    if result is None:  # Placeholder for the next analyzed upload
+                        result = next(analyzed)
+                    yield app.json.dumps(result) + '\n'
+
+        # Stream so the first rows reach the browser while later files are
+        # still being analyzed
+        return app.response_class(generate(), mimetype='application/x-ndjson')
 
-            try:
-                # Detect asset type
-                asset_type, confidence, scores = detect_asset_type(temp_path)
-
-                # Generate thumbnail for preview
-                from PIL import Image
-                with Image.open(temp_path) as img:
-                    # Create thumbnail (max 150x150)
-                    img.thumbnail((150, 150))
-                    buffer = io.BytesIO()
-                    img.save(buffer, format='PNG')
-                    thumbnail_b64 = base64.b64encode(buffer.getvalue()).decode()
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-                results.append({
-                    'filename': file.filename,
-                    'temp_filename': safe_filename,
-                    'success': True,
-                    'detected_type': asset_type,  # None if confidence < 50
-                    'confidence': confidence,
-                    'scores': {
-                        'background': scores.background,
-                        'character': scores.character,
-                        'title': scores.title,
-                        'logo': scores.logo
-                    },
-                    'thumbnail': f'data:image/png;base64,{thumbnail_b64}',
-                    'requires_manual': asset_type is None  # True if confidence < 50
-                })
 
-            except Exception as e:
-                results.append({
-                    'filename': file.filename,
-                    'success': False,
-                    'error': str(e),
-                    'detected_type': None,
-                    'confidence': 0
-                })
+def _clear_temp_uploads():
+    """
+    Empty temp_uploads/ without making the request wait on the deletes.
 
-        return jsonify({
-            'success': True,
-            'results': results,
-            'game_path': game_path,
-            'provider_path': provider_path
-        })
+    The directory is renamed aside (one rename), recreated empty and the old
+    copy is deleted on a background thread.
+    """
+    trash = None
+    try:
+        trash = tempfile.mkdtemp(prefix='.temp_uploads-old-', dir=TEMP_UPLOADS_DIR.parent)
+        os.replace(TEMP_UPLOADS_DIR, Path(trash) / TEMP_UPLOADS_DIR.name)
+    except OSError:
+        # Couldn't rename it aside; delete in place instead
+        shutil.rmtree(TEMP_UPLOADS_DIR, ignore_errors=True)
+    TEMP_UPLOADS_DIR.mkdir(exist_ok=True)
 
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return jsonify({'success': False, 'error': str(e)}), 500
+    if trash is not None:
+        Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True}, daemon=True).start()
 
 
 @app.route('/api/save-classified-assets', methods=['POST'])
@@ -983,10 +1533,11 @@ def save_classified_assets():
 
         game_dir = THUMBNAILS_ROOT / game_path
         provider_dir = THUMBNAILS_ROOT / provider_path if provider_path else None
-        temp_dir = Path(__file__).parent.parent / 'temp_uploads'
+        temp_dir = TEMP_UPLOADS_DIR
 
         saved_files = []
         errors = []
+        target_dirs = {}  # asset type -> created target folder
 
         for item in classifications:
             temp_filename = item.get('temp_filename')
@@ -1002,53 +1553,52 @@ def save_classified_assets():
                 errors.append(f"Temporary file not found: {temp_filename}")
                 continue
 
-            # Determine target folder based on asset type
-            if asset_type == 'background':
-                target_dir = game_dir / 'Backgrounds'
-            elif asset_type == 'character':
-                target_dir = game_dir / 'Character'
-            elif asset_type == 'title':
-                target_dir = game_dir / 'Title'
-            elif asset_type == 'logo':
-                if not provider_dir:
-                    errors.append(f"Provider path required for logo: {original_filename}")
+            # Determine target folder based on asset type, creating each
+            # folder once per request rather than once per file
+            target_dir = target_dirs.get(asset_type)
+            if target_dir is None:
+                if asset_type == 'logo':
+                    if not provider_dir:
+                        errors.append(f"Provider path required for logo: {original_filename}")
+                        continue
+                    target_dir = provider_dir / 'Provider Logo'
+                elif asset_type in ASSET_SUBDIRS:
+                    target_dir = game_dir / ASSET_SUBDIRS[asset_type]
+                else:
+                    errors.append(f"Invalid asset type '{asset_type}' for {original_filename}")
                     continue
-                target_dir = provider_dir / 'Provider Logo'
-            else:
-                errors.append(f"Invalid asset type '{asset_type}' for {original_filename}")
-                continue
 
-            # Create target directory if needed
-            target_dir.mkdir(parents=True, exist_ok=True)
-
-            # Handle duplicate filenames
-            target_path = target_dir / original_filename
-            if target_path.exists():
-                # Auto-rename with suffix
-                stem = Path(original_filename).stem
-                ext = Path(original_filename).suffix
-                counter = 1
-                while target_path.exists():
-                    target_path = target_dir / f"{stem}_{counter}{ext}"
-                    counter += 1
-
-            # Move file from temp to target
-            import shutil
-            shutil.move(str(temp_path), str(target_path))
+                # Create target directory if needed
+                target_dir.mkdir(parents=True, exist_ok=True)
+                target_dirs[asset_type] = target_dir
+
+            # Handle duplicate filenames (auto-rename with suffix)
+            name = Path(original_filename)
+            target_path = unique_path(target_dir, name.stem, name.suffix)
+
+            # Move file from temp to target: a single rename on the same
+            # filesystem, copy + delete only when crossing devices
+            try:
+                os.replace(temp_path, target_path)
+            except OSError:
+                shutil.move(str(temp_path), str(target_path))
             saved_files.append({
                 'filename': original_filename,
                 'type': asset_type,
                 'path': str(target_path.relative_to(THUMBNAILS_ROOT))
             })
 
-        # Clean up temp directory
+        # Clean up temp directory (uploads and their preview thumbnails)
         try:
-            if temp_dir.exists():
-                for f in temp_dir.glob('*'):
-                    f.unlink()
+            _clear_temp_uploads()
         except Exception:
             pass  # Ignore cleanup errors
 
+        # Saved files may replace images the preview caches already decoded
+        if saved_files:
+            preview_asset_cache.clear()
+            preview_image_cache.clear()
+
         if errors:
             return jsonify({
                 'success': False,
@@ -1063,15 +1613,56 @@ def save_classified_assets():
         })
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+# Background font upload jobs by id: {'status', 'total', 'done', 'uploaded', 'errors'}
+_font_jobs = {}
+_font_jobs_lock = Lock()
+# Finished jobs kept for /api/upload-fonts/status
+FONT_JOB_HISTORY = 50
+# Serializes picking a free name in fonts/ and moving the font there
+_font_write_lock = Lock()
+
+
+def _write_fonts(job_id, staged):
+    """Move staged font uploads into fonts/, recording progress on the job."""
+    job = _font_jobs[job_id]
+    for stem, ext, part_path in staged:
+        try:
+            with _font_write_lock:
+                # Auto-rename with counter if the font already exists
+                target_path = unique_path(FONTS_DIR, stem, ext)
+                os.replace(part_path, target_path)
+            entry = {'filename': target_path.name, 'path': f'fonts/{target_path.name}'}
+            error = None
+        except Exception as e:
+            entry = None
+            error = f"{stem}{ext}: {e}"
+            try:
+                os.unlink(part_path)
+            except OSError:
+                pass
+
+        with _font_jobs_lock:
+            if entry is not None:
+                job['uploaded'].append(entry)
+            else:
+                job['errors'].append(error)
+            job['done'] += 1
+
+    with _font_jobs_lock:
+        job['status'] = 'done'
+
+
 @app.route('/api/upload-fonts', methods=['POST'])
 def upload_fonts():
     """
     Upload font files (.ttf, .otf) to the fonts directory.
+
+    Files are validated here; moving them into fonts/ happens on a background
+    thread. Returns 202 with a job_id to poll at /api/upload-fonts/status/<job_id>.
     """
     try:
         files = request.files.getlist('files')
@@ -1079,67 +1670,105 @@ def upload_fonts():
         if not files:
             return jsonify({'success': False, 'error': 'No files provided'}), 400
 
-        fonts_dir = FONTS_ROOT
-        fonts_dir.mkdir(parents=True, exist_ok=True)
+        FONTS_DIR.mkdir(parents=True, exist_ok=True)
 
-        uploaded_fonts = []
+        staged = []  # (stem, ext, path of the uploaded file)
         errors = []
 
         for file in files:
             if not file.filename:
                 continue
 
-            filename = secure_filename(file.filename)
-            ext = Path(filename).suffix.lower()
+            filename = _safe_filename(file.filename)
+            stem, ext = os.path.splitext(filename)
+            ext = ext.lower()
 
             # Validate font file extension
-            if ext not in ['.ttf', '.otf']:
+            if ext not in FONT_EXTENSIONS:
                 errors.append(f"{filename}: Invalid font format (only .ttf and .otf allowed)")
                 continue
 
-            # Check if font already exists
-            target_path = fonts_dir / filename
-            if target_path.exists():
-                # Auto-rename with counter
-                stem = Path(filename).stem
-                counter = 1
-                while target_path.exists():
-                    target_path = fonts_dir / f"{stem}_{counter}{ext}"
-                    counter += 1
-                filename = target_path.name
-
-            # Save the font file
-            file.save(str(target_path))
-            uploaded_fonts.append({
-                'filename': filename,
-                'path': f'fonts/{filename}'
-            })
+            # Stage inside fonts/ (where the part was spooled) so the file
+            # outlives the request; the job only has to rename it
+            fd, part_path = tempfile.mkstemp(prefix='.part-', dir=FONTS_DIR)
+            os.close(fd)
+            try:
+                _save_upload(file, part_path)
+            except Exception:
+                os.unlink(part_path)
+                raise
+            staged.append((stem, ext, part_path))
 
-        if errors:
+        if not staged:
             return jsonify({
-                'success': False if not uploaded_fonts else True,
-                'uploaded': uploaded_fonts,
+                'success': False,
+                'uploaded': [],
+                'errors': errors
+            }), 400
+
+        job_id = uuid.uuid4().hex
+        with _font_jobs_lock:
+            finished = [key for key, job in _font_jobs.items() if job['status'] == 'done']
+            for key in finished[:max(0, len(finished) - FONT_JOB_HISTORY + 1)]:
+                del _font_jobs[key]
+            _font_jobs[job_id] = {
+                'status': 'running',
+                'total': len(staged),
+                'done': 0,
+                'uploaded': [],
                 'errors': errors
-            }), 400 if not uploaded_fonts else 200
+            }
+        Thread(target=_write_fonts, args=(job_id, staged), daemon=True).start()
 
         return jsonify({
             'success': True,
-            'uploaded': uploaded_fonts,
-            'message': f'Successfully uploaded {len(uploaded_fonts)} font(s)'
-        })
+            'job_id': job_id,
+            'total': len(staged),
+            'errors': errors
+        }), 202
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/upload-fonts/status/<job_id>')
+def upload_fonts_status(job_id):
+    """Progress of a background font upload started by /api/upload-fonts."""
+    with _font_jobs_lock:
+        job = _font_jobs.get(job_id)
+        if job is None:
+            return jsonify({'success': False, 'error': 'Unknown upload job'}), 404
+        uploaded = list(job['uploaded'])
+        status = {
+            'success': True,
+            'status': job['status'],
+            'total': job['total'],
+            'done': job['done'],
+            'uploaded': uploaded,
+            'errors': list(job['errors'])
+        }
+
+    if status['status'] == 'done':
+        status['message'] = f'Successfully uploaded {len(uploaded)} font(s)'
+    return jsonify(status)
+
+
 def open_browser():
     """Open the web browser after a short delay."""
     webbrowser.open('http://127.0.0.1:5000')
 
 
 if __name__ == '__main__':
+    # Required for the bulk worker processes in the packaged .exe
+    multiprocessing.freeze_support()
+
+    # Warnings and errors only by default: the loader and asset detector log
+    # at INFO on every upload and auto-detection
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    if os.environ.get('THUMBGEN_DEBUG'):
+        logging.getLogger('thumbgen').setLevel(logging.DEBUG)
+
     # Open browser automatically after 1 second
     Timer(1, open_browser).start()
 
@@ -1148,4 +1777,14 @@ if __name__ == '__main__':
     print("Opening browser at http://127.0.0.1:5000")
     print("Press Ctrl+C to stop the server")
 
-    app.run(debug=True, use_reloader=False)
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+
+    if serve is not None and not os.environ.get('THUMBGEN_DEBUG'):
+        # Multi-threaded production server, so uploads, previews and bulk
+        # runs don't queue behind each other
+        serve(app, host='127.0.0.1', port=5000, threads=8)
+    else:
+        app.run(debug=True, use_reloader=False)
@@ -10,6 +10,7 @@ let selectedProvider = '';
 // Live preview state
 let previewDebounceTimer = null;
 let previewInProgress = false;
+let previewObjectUrl = null;
 const DEBOUNCE_DELAY = 200; // milliseconds
 
 // Asset selection state
@@ -1165,12 +1166,15 @@ async function updateLivePreview() {
             })
         });
 
-        const data = await response.json();
-
-        if (data.success) {
-            previewImage.src = data.preview_image;
+        if (response.ok) {
+            // Raw PNG; release the previous preview's blob once replaced
+            const blob = await response.blob();
+            if (previewObjectUrl) URL.revokeObjectURL(previewObjectUrl);
+            previewObjectUrl = URL.createObjectURL(blob);
+            previewImage.src = previewObjectUrl;
             previewContainer.style.display = 'block';
         } else {
+            const data = await response.json();
             console.error('Preview failed:', data.error);
         }
     } catch (error) {
@@ -1545,24 +1549,33 @@ async function uploadAndAnalyzeAssets(files) {
             body: formData
         });
 
-        const data = await response.json();
-
-        if (!data.success) {
+        // Validation errors come back as plain JSON
+        if (!(response.headers.get('Content-Type') || '').includes('ndjson')) {
+            const data = await response.json();
             uploadStatus.textContent = 'Error: ' + data.error;
             uploadStatus.style.color = '#ef4444';
             uploadProgress.style.display = 'none';
             return;
         }
 
-        // Store classification data
-        classificationData = data.results;
-
-        // Hide progress, show results
-        uploadProgress.style.display = 'none';
-        classificationResults.style.display = 'block';
+        // Results stream in as JSON lines (first line is the header), so rows
+        // appear as each file is analyzed
+        classificationData = [];
+        classificationTableBody.innerHTML = '';
+        let headerSeen = false;
 
-        // Populate classification table
-        populateClassificationTable(data.results);
+        await readJsonLines(response, (line) => {
+            if (!headerSeen) {
+                headerSeen = true;
+                // Hide progress, show results
+                uploadProgress.style.display = 'none';
+                classificationResults.style.display = 'block';
+                return;
+            }
+            // Store classification data and add its table row
+            classificationData.push(line);
+            appendClassificationRow(line, classificationData.length - 1);
+        });
 
     } catch (error) {
         uploadStatus.textContent = 'Failed to upload: ' + error.message;
@@ -1571,94 +1584,111 @@ async function uploadAndAnalyzeAssets(files) {
     }
 }
 
-function populateClassificationTable(results) {
-    classificationTableBody.innerHTML = '';
+async function readJsonLines(response, onLine) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = '';
 
-    results.forEach((result, index) => {
-        const row = document.createElement('tr');
+    while (true) {
+        const { done, value } = await reader.read();
+        buffered += decoder.decode(value || new Uint8Array(), { stream: !done });
 
-        // Mark low confidence rows
-        if (result.requires_manual) {
-            row.style.backgroundColor = '#fef2f2';  // Light red
+        let newline;
+        while ((newline = buffered.indexOf('\n')) !== -1) {
+            const text = buffered.slice(0, newline).trim();
+            buffered = buffered.slice(newline + 1);
+            if (text) onLine(JSON.parse(text));
         }
 
-        // Preview thumbnail
-        const previewCell = document.createElement('td');
-        if (result.thumbnail) {
-            const img = document.createElement('img');
-            img.src = result.thumbnail;
-            img.style.width = '60px';
-            img.style.height = '60px';
-            img.style.objectFit = 'contain';
-            previewCell.appendChild(img);
-        }
-        row.appendChild(previewCell);
+        if (done) break;
+    }
+    if (buffered.trim()) onLine(JSON.parse(buffered));
+}
 
-        // Filename
-        const filenameCell = document.createElement('td');
-        filenameCell.textContent = result.filename;
-        row.appendChild(filenameCell);
+function appendClassificationRow(result, index) {
+    const row = document.createElement('tr');
 
-        // Detected type
-        const typeCell = document.createElement('td');
-        typeCell.textContent = result.detected_type || 'Unknown';
+    // Mark low confidence rows
+    if (result.requires_manual) {
+        row.style.backgroundColor = '#fef2f2';  // Light red
+    }
+
+    // Preview thumbnail
+    const previewCell = document.createElement('td');
+    if (result.thumbnail) {
+        const img = document.createElement('img');
+        img.src = result.thumbnail;
+        img.style.width = '60px';
+        img.style.height = '60px';
+        img.style.objectFit = 'contain';
+        previewCell.appendChild(img);
+    }
+    row.appendChild(previewCell);
+
+    // Filename
+    const filenameCell = document.createElement('td');
+    filenameCell.textContent = result.filename;
+    row.appendChild(filenameCell);
+
+    // Detected type
+    const typeCell = document.createElement('td');
+    typeCell.textContent = result.detected_type || 'Unknown';
+    if (result.requires_manual) {
+        typeCell.style.color = '#dc2626';
+        typeCell.style.fontWeight = 'bold';
+    }
+    row.appendChild(typeCell);
+
+    // Confidence
+    const confidenceCell = document.createElement('td');
+    if (result.success) {
+        confidenceCell.textContent = `${result.confidence.toFixed(0)}%`;
         if (result.requires_manual) {
-            typeCell.style.color = '#dc2626';
-            typeCell.style.fontWeight = 'bold';
-        }
-        row.appendChild(typeCell);
-
-        // Confidence
-        const confidenceCell = document.createElement('td');
-        if (result.success) {
-            confidenceCell.textContent = `${result.confidence.toFixed(0)}%`;
-            if (result.requires_manual) {
-                confidenceCell.style.color = '#dc2626';
-            }
-        } else {
-            confidenceCell.textContent = 'Error';
             confidenceCell.style.color = '#dc2626';
         }
-        row.appendChild(confidenceCell);
-
-        // Override dropdown
-        const overrideCell = document.createElement('td');
-        const select = document.createElement('select');
-        select.className = 'select-input';
-        select.dataset.index = index;
-
-        const options = [
-            { value: 'background', label: 'Background' },
-            { value: 'character', label: 'Character' },
-            { value: 'title', label: 'Title' },
-            { value: 'logo', label: 'Logo' }
-        ];
-
-        options.forEach(opt => {
-            const option = document.createElement('option');
-            option.value = opt.value;
-            option.textContent = opt.label;
-            if (opt.value === result.detected_type) {
-                option.selected = true;
-            }
-            select.appendChild(option);
-        });
+    } else {
+        confidenceCell.textContent = 'Error';
+        confidenceCell.style.color = '#dc2626';
+    }
+    row.appendChild(confidenceCell);
 
-        select.addEventListener('change', (e) => {
-            classificationData[index].detected_type = e.target.value;
-            classificationData[index].requires_manual = false;
-            // Remove red highlighting
-            row.style.backgroundColor = '';
-            typeCell.style.color = '';
-            typeCell.style.fontWeight = '';
-            confidenceCell.style.color = '';
-        });
+    // Override dropdown
+    const overrideCell = document.createElement('td');
+    const select = document.createElement('select');
+    select.className = 'select-input';
+    select.dataset.index = index;
 
-        overrideCell.appendChild(select);
-        row.appendChild(overrideCell);
+    const options = [
+        { value: 'background', label: 'Background' },
+        { value: 'character', label: 'Character' },
+        { value: 'title', label: 'Title' },
+        { value: 'logo', label: 'Logo' }
+    ];
 
-        classificationTableBody.appendChild(row);
+    options.forEach(opt => {
+        const option = document.createElement('option');
+        option.value = opt.value;
+        option.textContent = opt.label;
+        if (opt.value === result.detected_type) {
+            option.selected = true;
+        }
+        select.appendChild(option);
     });
+
+    select.addEventListener('change', (e) => {
+        classificationData[index].detected_type = e.target.value;
+        classificationData[index].requires_manual = false;
+        // Remove red highlighting
+        row.style.backgroundColor = '';
+        typeCell.style.color = '';
+        typeCell.style.fontWeight = '';
+        confidenceCell.style.color = '';
+    });
+
+    overrideCell.appendChild(select);
+    row.appendChild(overrideCell);
+
+    classificationTableBody.appendChild(row);
 }
 
 async function saveClassifiedAssets() {
@@ -2101,7 +2131,12 @@ async function uploadFonts(files) {
             body: formData
         });
 
-        const data = await response.json();
+        let data = await response.json();
+
+        // 202: fonts are written in the background, poll until the job is done
+        if (response.status === 202) {
+            data = await waitForFontUpload(data.job_id);
+        }
 
         if (data.success) {
             selectedFontsInfo.textContent = '';
@@ -2131,6 +2166,21 @@ async function uploadFonts(files) {
     }
 }
 
+async function waitForFontUpload(jobId) {
+    while (true) {
+        await new Promise(resolve => setTimeout(resolve, 250));
+        const response = await fetch(`/api/upload-fonts/status/${jobId}`);
+        const status = await response.json();
+        if (!status.success || status.status === 'done') {
+            if (status.success && status.uploaded.length === 0) {
+                return { success: false, error: status.errors.join('; ') };
+            }
+            return status;
+        }
+        selectedFontsInfo.textContent = `Uploading fonts... ${status.done}/${status.total}`;
+    }
+}
+
 // ===== Asset Preview Tooltip =====
 let previewTooltip = null;
 